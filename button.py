@@ -93,4 +93,5 @@ class SimpleButton:
             self.current_color = self.base_color
 
     def check_click(self, mouse_pos):
+        """mouse_pos is in logical coordinates; pygame.SCALED maps window pixels for us."""
         return self.rect.collidepoint(mouse_pos)
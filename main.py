@@ -3,13 +3,16 @@ import random
 import sys
 from question_manager import QuestionManager
 from button import SimpleButton
+from session_logger import SessionLogger
 
 # Initialize Pygame
 pygame.init()
 
 # Constants
+# Logical resolution: all layout, spawning and hit-testing happen in these coordinates
 WIDTH, HEIGHT = 800, 600
 FPS = 60
+FULLSCREEN = "--fullscreen" in sys.argv
 
 # --- CYBERPUNK PALETTE ---
 BG_COLOR = (5, 5, 12)           # Very Dark Blue/Black
@@ -22,7 +25,11 @@ WHITE_GLOW = (220, 240, 255)    # Text
 GREY_PASSIVE = (60, 60, 70)     # Passive UI
 
 # Setup Display
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+# The game always draws at WIDTH x HEIGHT. pygame.SCALED lets SDL upscale that
+# on the GPU to any window/fullscreen size and maps mouse positions back to
+# these logical coordinates, so per-frame pixel work does not grow with the display.
+display_flags = pygame.SCALED | (pygame.FULLSCREEN if FULLSCREEN else 0)
+screen = pygame.display.set_mode((WIDTH, HEIGHT), display_flags)
 pygame.display.set_caption("Mind Defender")
 clock = pygame.time.Clock()
 
@@ -95,6 +102,8 @@ class Enemy:
         self.question = question
         self.answer = answer
         self.speed = speed
+        self.enemy_id = 0 # assigned later (telemetry)
+        self.spawn_time = 0
         self.x = 0 # assigned later
         self.y = -60
         self.color = random.choice([NEON_GREEN, NEON_PINK, NEON_BLUE])
@@ -177,6 +186,7 @@ play_button = SimpleButton((WIDTH - 200)//2, 450, 200, 60, "BAŞLAT [ENTER]", fo
 # --- GLOBAL STATE ---
 qm = QuestionManager()
 matrix_bg = MatrixRain()
+telemetry = SessionLogger()
 
 STATE_MENU = 0
 STATE_PLAYING = 1
@@ -192,6 +202,15 @@ score = 0
 lives = 3
 spawn_interval = 2000
 wrong_answer_feedback = 0
+next_enemy_id = 0
+
+# Frame-time stats, summarised into one telemetry event every FRAME_STATS_WINDOW frames
+FRAME_STATS_WINDOW = FPS * 5
+SLOW_FRAME_MS = 1000 // FPS + 5
+frame_count = 0
+frame_total_ms = 0
+frame_max_ms = 0
+frame_slow_count = 0
 
 SPAWN_EVENT = pygame.USEREVENT + 1
 pygame.time.set_timer(SPAWN_EVENT, spawn_interval)
@@ -203,6 +222,20 @@ def get_difficulty(current_score, selected_mode):
     elif current_score < 150: return "orta"
     else: return "zor"
 
+def flush_frame_stats():
+    global frame_count, frame_total_ms, frame_max_ms, frame_slow_count
+    if frame_count:
+        telemetry.log("frames", pygame.time.get_ticks(), frame_count,
+                      round(frame_total_ms / frame_count, 2), frame_max_ms, frame_slow_count)
+    frame_count = 0
+    frame_total_ms = 0
+    frame_max_ms = 0
+    frame_slow_count = 0
+
+def end_session(reason):
+    flush_frame_stats()
+    telemetry.end_session(pygame.time.get_ticks(), score, reason)
+
 def reset_game():
     global score, lives, enemies, user_text, spawn_interval
     score = 0
@@ -211,6 +244,7 @@ def reset_game():
     user_text = ""
     spawn_interval = 2000
     pygame.time.set_timer(SPAWN_EVENT, spawn_interval)
+    telemetry.start_session(pygame.time.get_ticks(), CATEGORIES[selected_cat_idx], DIFFICULTIES[selected_diff_idx])
 
 def draw_background():
     screen.fill(BG_COLOR)
@@ -347,12 +381,14 @@ running = True
 while running:
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
+            if current_state == STATE_PLAYING:
+                end_session("quit")
             running = False
             
         # STATE: MENU
         if current_state == STATE_MENU:
             if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = event.pos
                 
                 for i, btn in enumerate(cat_buttons):
                     if btn.check_click(mouse_pos):
@@ -422,8 +458,12 @@ while running:
                         new_enemy = Enemy(qa[0], qa[1], final_speed)
                         new_enemy.x = final_x
                         new_enemy.rect.x = final_x 
+                        next_enemy_id += 1
+                        new_enemy.enemy_id = next_enemy_id
+                        new_enemy.spawn_time = pygame.time.get_ticks()
                         
                         enemies.append(new_enemy)
+                        telemetry.log("spawn", new_enemy.spawn_time, new_enemy.enemy_id, qa[0], category, qa[2], round(final_speed, 2))
                         
                         new_interval = max(600, 2000 - (score // 50) * 100)
                         if new_interval != spawn_interval:
@@ -440,15 +480,19 @@ while running:
                             break
                     if matched_enemy:
                         enemies.remove(matched_enemy)
+                        now = pygame.time.get_ticks()
+                        telemetry.log("answer", now, matched_enemy.enemy_id, now - matched_enemy.spawn_time)
                         user_text = ""
                         score += 10
                     else:
                         if len(user_text) > 0: # Only punish if typed something
+                             telemetry.log("wrong", pygame.time.get_ticks(), user_text)
                              wrong_answer_feedback = 15
                              user_text = ""
                 elif event.key == pygame.K_BACKSPACE:
                     user_text = user_text[:-1]
                 elif event.key == pygame.K_ESCAPE:
+                    end_session("menu")
                     current_state = STATE_MENU
                 else:
                     user_text += event.unicode
@@ -467,8 +511,11 @@ while running:
             enemy.update()
             if enemy.y > HEIGHT - 90: # Hit area
                 enemies.remove(enemy)
+                now = pygame.time.get_ticks()
+                telemetry.log("miss", now, enemy.enemy_id, now - enemy.spawn_time)
                 lives -= 1
-                if lives <= 0:
+                if lives <= 0 and current_state != STATE_GAMEOVER:
+                    end_session("gameover")
                     current_state = STATE_GAMEOVER
         if wrong_answer_feedback > 0:
             wrong_answer_feedback -= 1
@@ -480,7 +527,16 @@ while running:
     elif current_state == STATE_GAMEOVER:
         draw_gameover()
 
-    clock.tick(FPS)
-
+    frame_ms = clock.tick(FPS)
+    if current_state == STATE_PLAYING:
+        # Hot loop only accumulates; one summary tuple is enqueued per window
+        frame_count += 1
+        frame_total_ms += frame_ms
+        if frame_ms > frame_max_ms: frame_max_ms = frame_ms
+        if frame_ms > SLOW_FRAME_MS: frame_slow_count += 1
+        if frame_count >= FRAME_STATS_WINDOW:
+            flush_frame_stats()
+
+telemetry.close()
 pygame.quit()
 sys.exit()
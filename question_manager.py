@@ -80,10 +80,12 @@ class QuestionManager:
     def get_question(self, category, difficulty="kolay"):
         """
         Retrieves a question. Falls back to easier difficulties if data is missing.
+        Returns (question, answer, difficulty) where difficulty is the pool actually used.
         """
         # 1. Handle Math Dynamically
         if category == "matematik":
-            return self.generate_math_question(difficulty)
+            question, answer = self.generate_math_question(difficulty)
+            return question, answer, difficulty
         
         # 2. Handle JSON Categories
         if category not in self.data:
@@ -97,14 +99,16 @@ class QuestionManager:
             target_diffs = ["orta", "kolay"]
         
         selected_pool = None
+        selected_diff = None
         for diff in target_diffs:
             if diff in self.data[category] and self.data[category][diff]:
                 selected_pool = self.data[category][diff]
+                selected_diff = diff
                 break
         
         if selected_pool:
             question = random.choice(list(selected_pool.keys()))
             answer = selected_pool[question]
-            return question, answer
+            return question, answer, selected_diff
             
         return None
@@ -0,0 +1,101 @@
+import json
+import queue
+import threading
+import time
+
+# Field names for each event kind. The game loop only enqueues plain tuples
+# (kind, ticks, session_id, *fields); the writer thread turns them into dicts.
+EVENT_FIELDS = {
+    "session_start": ("category", "mode", "wall_time"),
+    "spawn": ("enemy_id", "question", "category", "difficulty", "speed"),
+    "answer": ("enemy_id", "elapsed_ms"),
+    "miss": ("enemy_id", "elapsed_ms"),
+    "wrong": ("text",),
+    "frames": ("count", "avg_ms", "max_ms", "slow_count"),
+    "session_end": ("score", "reason", "dropped"),
+}
+
+_STOP = object()
+
+
+class SessionLogger:
+    """
+    Append-only JSONL session telemetry written by a background thread.
+    log() never blocks: when the queue is full the event is dropped and counted.
+    """
+    def __init__(self, filename="session_log.jsonl", max_queue=2048, batch_size=64, flush_interval=1.0):
+        self.filename = filename
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self._dropped_at_start = 0
+        self.session_id = None
+        self._thread = threading.Thread(target=self._run, name="SessionLogger", daemon=True)
+        self._thread.start()
+
+    def start_session(self, ticks, category, mode):
+        self.session_id = f"{int(time.time() * 1000):x}"
+        self._dropped_at_start = self.dropped
+        self.log("session_start", ticks, category, mode, time.time())
+
+    def log(self, kind, ticks, *fields):
+        if self.session_id is None:
+            return
+        try:
+            self.queue.put_nowait((kind, ticks, self.session_id) + fields)
+        except queue.Full:
+            self.dropped += 1
+
+    def end_session(self, ticks, score, reason, timeout=0.5):
+        # Only called at session boundaries, so wait briefly for room: this record
+        # carries the dropped count the analysis needs to spot gaps.
+        if self.session_id is None:
+            return
+        dropped = self.dropped - self._dropped_at_start
+        try:
+            self.queue.put(("session_end", ticks, self.session_id, score, reason, dropped), timeout=timeout)
+        except queue.Full:
+            self.dropped += 1
+        self.session_id = None
+
+    def close(self, timeout=2.0):
+        # Block (briefly) so the sentinel is not lost to a full queue on shutdown
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        running = True
+        while running:
+            try:
+                item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                if item is _STOP:
+                    running = False
+                else:
+                    batch.append(item)
+            except queue.Empty:
+                pass
+
+            if batch and (not running or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(batch)
+                batch = []
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+
+    def _write(self, batch):
+        lines = []
+        for kind, ticks, session_id, *fields in batch:
+            record = {"session": session_id, "event": kind, "t": ticks}
+            record.update(zip(EVENT_FIELDS.get(kind, ()), fields))
+            lines.append(json.dumps(record, ensure_ascii=False))
+        try:
+            with open(self.filename, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError:
+            # Telemetry must never take the game down
+            pass